@@ -12,15 +12,15 @@ functions that operate on FRD data.
 
 from collections.abc import Iterable
 from copy import copy
+from io import StringIO
 from warnings import warn
 
 import numpy as np
-from numpy import absolute, angle, array, empty, eye, imag, linalg, ones, \
+from numpy import absolute, angle, array, empty, imag, linalg, ones, \
     real, sort, where
 from scipy.interpolate import splev, splprep
 
 from . import config
-from . import bdalg
 from .exception import pandas_check
 from .iosys import InputOutputSystem, NamedSignal, _extended_system_name, \
     _process_iosys_keywords, _process_subsys_index, common_timebase
@@ -93,6 +93,8 @@ class FrequencyResponseData(LTI):
         system that created the data.
     magnitude : array
         Magnitude of the frequency response, indexed by frequency.
+    magnitude_squared : array
+        Squared magnitude of the frequency response, indexed by frequency.
     phase : array
         Phase of the frequency response, indexed by frequency.
 
@@ -194,6 +196,16 @@ class FrequencyResponseData(LTI):
         """
         smooth = kwargs.pop('smooth', False)
 
+        # Internal callers pass freshly computed, frequency-first response
+        # data that the constructor can take ownership of without copying
+        batch_first = kwargs.pop('_batch_first', False)
+
+        # Caches for the magnitude and phase properties and for the
+        # signal-name map used by __getitem__
+        self._mag_cache = None
+        self._phase_cache = None
+        self._iomap = None
+
         #
         # Process positional arguments
         #
@@ -218,7 +230,12 @@ class FrequencyResponseData(LTI):
                     s = 1j * self.omega
                     self.fresp = otherlti(s, squeeze=False)
                 else:
-                    z = np.exp(1j * self.omega * otherlti.dt)
+                    # z = exp(1j * omega * dt), via sin/cos to avoid a
+                    # complex exponential over an intermediate complex array
+                    theta = self.omega * otherlti.dt
+                    z = empty(theta.shape, dtype=complex)
+                    z.real = np.cos(theta)
+                    z.imag = np.sin(theta)
                     self.fresp = otherlti(z, squeeze=False)
                 arg_dt = otherlti.dt
 
@@ -230,11 +247,28 @@ class FrequencyResponseData(LTI):
                     kwargs['name'] = kwargs.get('name', _extended_system_name(
                         otherlti.name, prefix_suffix_name='sampled'))
 
+            elif batch_first:
+                # Frequency-first data computed by an FRD operation; take
+                # ownership directly, skipping the layout conversion and
+                # defensive copy needed for user-supplied data
+                self._fresp_batch = np.ascontiguousarray(args[0])
+                self.omega = args[1]
+                arg_dt = None
+
             else:
-                # The user provided a response and a freq vector
-                self.fresp = array(args[0], dtype=complex, ndmin=1)
-                if self.fresp.ndim == 1:
-                    self.fresp = self.fresp.reshape(1, 1, -1)
+                # The user provided a response and a freq vector; only
+                # copy the response if it is not already complex data
+                fresp = np.asarray(args[0])
+                if fresp.dtype != np.complex128 or fresp.ndim < 1:
+                    fresp = array(args[0], dtype=complex, ndmin=1)
+                if fresp.ndim == 1:
+                    fresp = fresp.reshape(1, 1, -1)
+                self.fresp = fresp
+                if isinstance(args[0], np.ndarray) and \
+                        np.may_share_memory(self._fresp_batch, args[0]):
+                    # Don't alias an array the caller still owns; mutating
+                    # it would silently invalidate the cached data
+                    self._fresp_batch = self._fresp_batch.copy()
                 self.omega = array(args[1], dtype=float, ndmin=1)
                 if self.fresp.ndim != 3 or self.omega.ndim != 1 or \
                         self.fresp.shape[-1] != self.omega.shape[-1]:
@@ -242,6 +276,12 @@ class FrequencyResponseData(LTI):
                         "The frequency data constructor needs a 1-d or 3-d"
                         " response data array and a matching frequency vector"
                         " size")
+                if not np.all(self.omega[1:] >= self.omega[:-1]):
+                    # Keep the frequency vector sorted (eval and friends
+                    # rely on this), reordering the response data to match
+                    sort_idx = np.argsort(self.omega)
+                    self.omega = self.omega[sort_idx]
+                    self._fresp_batch = self._fresp_batch[sort_idx]
                 arg_dt = None
 
         elif len(args) == 1:
@@ -251,7 +291,7 @@ class FrequencyResponseData(LTI):
                     "The one-argument constructor can only take in"
                     " an FRD object.  Received %s." % type(args[0]))
             self.omega = args[0].omega
-            self.fresp = args[0].fresp
+            self._fresp_batch = args[0]._fresp_batch
             arg_dt = args[0].dt
 
             # Copy over signal and system names, if not specified
@@ -310,15 +350,18 @@ class FrequencyResponseData(LTI):
                 raise ValueError("can't smooth with only 1 frequency")
             degree = 3 if self.omega.size > 3 else self.omega.size - 1
 
-            self._ifunc = empty((self.fresp.shape[0], self.fresp.shape[1]),
-                               dtype=tuple)
-            for i in range(self.fresp.shape[0]):
-                for j in range(self.fresp.shape[1]):
+            # Precompute the spline data for all channels in one pass
+            re_all = self._fresp_batch.real
+            im_all = self._fresp_batch.imag
+            weights = 1.0 / (absolute(self._fresp_batch) + 0.001)
+
+            self._ifunc = empty((self.noutputs, self.ninputs), dtype=tuple)
+            for i in range(self.noutputs):
+                for j in range(self.ninputs):
                     self._ifunc[i, j], u = splprep(
-                        u=self.omega, x=[real(self.fresp[i, j, :]),
-                                         imag(self.fresp[i, j, :])],
-                        w=1.0/(absolute(self.fresp[i, j, :]) + 0.001),
-                        s=0.0, k=degree)
+                        u=self.omega,
+                        x=[re_all[:, i, j], im_all[:, i, j]],
+                        w=weights[:, i, j], s=0.0, k=degree)
         else:
             self._ifunc = None
 
@@ -329,6 +372,30 @@ class FrequencyResponseData(LTI):
     # analysis and characterization.
     #
 
+    @property
+    def fresp(self):
+        """Frequency response data, indexed by output, input, and frequency.
+
+        The data are stored internally with the frequency axis first, so
+        that operations at each frequency can use NumPy's batched matrix
+        routines; this property presents the canonical (outputs, inputs,
+        frequency) layout as a read-only view, without copying.  To change
+        the response data, assign a new array to the attribute.
+
+        :type: 3D array
+
+        """
+        fresp = np.moveaxis(self._fresp_batch, 0, -1)
+        fresp.flags.writeable = False
+        return fresp
+
+    @fresp.setter
+    def fresp(self, value):
+        self._fresp_batch = np.ascontiguousarray(
+            np.moveaxis(np.asarray(value), -1, 0))
+        self._mag_cache = None
+        self._phase_cache = None
+
     @property
     def magnitude(self):
         """Magnitude of the frequency response.
@@ -345,8 +412,11 @@ class FrequencyResponseData(LTI):
         :type: 1D, 2D, or 3D array
 
         """
+        if self._mag_cache is None:
+            self._mag_cache = np.moveaxis(np.abs(self._fresp_batch), 0, -1)
+            self._mag_cache.flags.writeable = False
         return NamedSignal(
-            np.abs(self.fresp), self.output_labels, self.input_labels)
+            self._mag_cache, self.output_labels, self.input_labels)
 
     @property
     def phase(self):
@@ -364,8 +434,34 @@ class FrequencyResponseData(LTI):
         :type: 1D, 2D, or 3D array
 
         """
+        if self._phase_cache is None:
+            # arctan2 on the real/imag views stays in real-domain ufuncs
+            self._phase_cache = np.moveaxis(
+                np.arctan2(self._fresp_batch.imag, self._fresp_batch.real),
+                0, -1)
+            self._phase_cache.flags.writeable = False
+        return NamedSignal(
+            self._phase_cache, self.output_labels, self.input_labels)
+
+    @property
+    def magnitude_squared(self):
+        """Squared magnitude of the frequency response.
+
+        Squared magnitude of the frequency response, indexed in the same
+        way as :attr:`FrequencyResponseData.magnitude`.  Computed as
+        ``re**2 + im**2`` in a single pass, avoiding the square root in
+        `magnitude` for consumers that need the power or log-magnitude.
+
+        Input and output signal names can be used to index the data in
+        place of integer offsets.
+
+        :type: 1D, 2D, or 3D array
+
+        """
+        fresp = self._fresp_batch
         return NamedSignal(
-            np.angle(self.fresp), self.output_labels, self.input_labels)
+            np.moveaxis(fresp.real**2 + fresp.imag**2, 0, -1),
+            self.output_labels, self.input_labels)
 
     @property
     def frequency(self):
@@ -411,11 +507,14 @@ class FrequencyResponseData(LTI):
                         "\nInput %i to output %i:" % (i + 1, j + 1))
                 outstr.append(nl + 'Freq [rad/s]  Response')
                 outstr.append(sp + '------------  ---------------------')
-                outstr.extend(
-                    [sp + '%12.3f  %10.4g%+10.4gj' % (w, re, im)
-                     for w, re, im in zip(self.omega,
-                                          real(self.fresp[j, i, :]),
-                                          imag(self.fresp[j, i, :]))])
+
+                # Format the data table in a single (vectorized) call
+                block = np.column_stack(
+                    (self.omega, real(self._fresp_batch[:, j, i]),
+                     imag(self._fresp_batch[:, j, i])))
+                buf = StringIO()
+                np.savetxt(buf, block, fmt=sp + '%12.3f  %10.4g%+10.4gj')
+                outstr.append(buf.getvalue().rstrip('\n'))
 
         return '\n'.join(outstr)
 
@@ -435,15 +534,14 @@ class FrequencyResponseData(LTI):
     def __neg__(self):
         """Negate a transfer function."""
 
-        return FRD(-self.fresp, self.omega)
+        return FRD(-self._fresp_batch, self.omega, _batch_first=True)
 
     def __add__(self, other):
         """Add two LTI objects (parallel connection)."""
 
-        if isinstance(other, FRD):
+        if isinstance(other, FRD) and other.omega is not self.omega:
             # verify that the frequencies match
-            if len(other.omega) != len(self.omega) or \
-               (other.omega != self.omega).any():
+            if not np.array_equal(other.omega, self.omega):
                 warn("Frequency points do not match; expect "
                      "truncation and interpolation.")
 
@@ -456,23 +554,21 @@ class FrequencyResponseData(LTI):
         else:
             other = _convert_to_frd(other, omega=self.omega)
 
-        # Promote SISO object to compatible dimension
-        if self.issiso() and not other.issiso():
-            self = np.ones((other.noutputs, other.ninputs)) * self
-        elif not self.issiso() and other.issiso():
-            other = np.ones((self.noutputs, self.ninputs)) * other
-
-        # Check that the input-output sizes are consistent.
-        if self.ninputs != other.ninputs:
-            raise ValueError(
-                "The first summand has %i input(s), but the " \
-                "second has %i." % (self.ninputs, other.ninputs))
-        if self.noutputs != other.noutputs:
-            raise ValueError(
-                "The first summand has %i output(s), but the " \
-                "second has %i." % (self.noutputs, other.noutputs))
+        # Check that the input-output sizes are consistent; a SISO
+        # response broadcasts against any shape, so no promotion of the
+        # response data is needed
+        if not self.issiso() and not other.issiso():
+            if self.ninputs != other.ninputs:
+                raise ValueError(
+                    "The first summand has %i input(s), but the " \
+                    "second has %i." % (self.ninputs, other.ninputs))
+            if self.noutputs != other.noutputs:
+                raise ValueError(
+                    "The first summand has %i output(s), but the " \
+                    "second has %i." % (self.noutputs, other.noutputs))
 
-        return FRD(self.fresp + other.fresp, other.omega)
+        return FRD(self._fresp_batch + other._fresp_batch, other.omega,
+                   _batch_first=True)
 
     def __radd__(self, other):
         """Right add two LTI objects (parallel connection)."""
@@ -494,16 +590,19 @@ class FrequencyResponseData(LTI):
 
         # Convert the second argument to a transfer function.
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * other, self.omega,
-                       smooth=(self._ifunc is not None))
+            return FRD(self._fresp_batch * other, self.omega,
+                       smooth=(self._ifunc is not None), _batch_first=True)
         else:
             other = _convert_to_frd(other, omega=self.omega)
 
-        # Promote SISO object to compatible dimension
-        if self.issiso() and not other.issiso():
-            self = bdalg.append(*([self] * other.noutputs))
-        elif not self.issiso() and other.issiso():
-            other = bdalg.append(*([other] * self.ninputs))
+        # A SISO operand acts as a scalar gain, so broadcast the
+        # elementwise product instead of promoting it to a diagonal
+        # MIMO system
+        if self.issiso() or other.issiso():
+            return FRD(self._fresp_batch * other._fresp_batch, self.omega,
+                       smooth=(self._ifunc is not None) and
+                              (other._ifunc is not None),
+                       _batch_first=True)
 
         # Check that the input-output sizes are consistent.
         if self.ninputs != other.noutputs:
@@ -512,31 +611,31 @@ class FrequencyResponseData(LTI):
                 "G1 has %i input(s), G2 has %i output(s)." %
                 (self.ninputs, other.noutputs))
 
-        inputs = other.ninputs
-        outputs = self.noutputs
-        fresp = empty((outputs, inputs, len(self.omega)),
-                      dtype=self.fresp.dtype)
-        for i in range(len(self.omega)):
-            fresp[:, :, i] = self.fresp[:, :, i] @ other.fresp[:, :, i]
-        return FRD(fresp, self.omega,
+        # Multiply the frequency responses at all frequencies at once
+        # (matmul batches over the leading frequency axis)
+        return FRD(self._fresp_batch @ other._fresp_batch, self.omega,
                    smooth=(self._ifunc is not None) and
-                          (other._ifunc is not None))
+                          (other._ifunc is not None),
+                   _batch_first=True)
 
     def __rmul__(self, other):
         """Right Multiply two LTI objects (serial connection)."""
 
         # Convert the second argument to an frd function.
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * other, self.omega,
-                       smooth=(self._ifunc is not None))
+            return FRD(self._fresp_batch * other, self.omega,
+                       smooth=(self._ifunc is not None), _batch_first=True)
         else:
             other = _convert_to_frd(other, omega=self.omega)
 
-        # Promote SISO object to compatible dimension
-        if self.issiso() and not other.issiso():
-            self = bdalg.append(*([self] * other.ninputs))
-        elif not self.issiso() and other.issiso():
-            other = bdalg.append(*([other] * self.noutputs))
+        # A SISO operand acts as a scalar gain, so broadcast the
+        # elementwise product instead of promoting it to a diagonal
+        # MIMO system
+        if self.issiso() or other.issiso():
+            return FRD(other._fresp_batch * self._fresp_batch, self.omega,
+                       smooth=(self._ifunc is not None) and
+                              (other._ifunc is not None),
+                       _batch_first=True)
 
         # Check that the input-output sizes are consistent.
         if self.noutputs != other.ninputs:
@@ -545,48 +644,52 @@ class FrequencyResponseData(LTI):
                 "G1 has %i input(s), G2 has %i output(s)." %
                 (other.ninputs, self.noutputs))
 
-        inputs = self.ninputs
-        outputs = other.noutputs
-
-        fresp = empty((outputs, inputs, len(self.omega)),
-                      dtype=self.fresp.dtype)
-        for i in range(len(self.omega)):
-            fresp[:, :, i] = other.fresp[:, :, i] @ self.fresp[:, :, i]
-        return FRD(fresp, self.omega,
+        # Multiply the frequency responses at all frequencies at once
+        # (matmul batches over the leading frequency axis)
+        return FRD(other._fresp_batch @ self._fresp_batch, self.omega,
                    smooth=(self._ifunc is not None) and
-                          (other._ifunc is not None))
+                          (other._ifunc is not None),
+                   _batch_first=True)
 
-    # TODO: Division of MIMO transfer function objects is not written yet.
     def __truediv__(self, other):
         """Divide two LTI objects."""
 
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(self.fresp * (1/other), self.omega,
-                       smooth=(self._ifunc is not None))
+            return FRD(self._fresp_batch * (1/other), self.omega,
+                       smooth=(self._ifunc is not None), _batch_first=True)
         else:
             other = _convert_to_frd(other, omega=self.omega)
 
         if (other.ninputs > 1 or other.noutputs > 1):
-            # FRD.__truediv__ is currently only implemented for SISO systems
-            return NotImplemented
-
-        return FRD(self.fresp/other.fresp, self.omega,
+            # G1/G2 = G1 * inv(G2), with the inverse batched over the
+            # frequency axis
+            if other.ninputs != other.noutputs:
+                raise ValueError(
+                    "H = G1/G2: G2 must be square for MIMO division")
+            if self.ninputs != other.noutputs:
+                raise ValueError(
+                    "H = G1/G2: input-output size mismatch: "
+                    "G1 has %i input(s), G2 has %i output(s)." %
+                    (self.ninputs, other.noutputs))
+            return FRD(self._fresp_batch @ linalg.inv(other._fresp_batch),
+                       self.omega,
+                       smooth=(self._ifunc is not None) and
+                              (other._ifunc is not None),
+                       _batch_first=True)
+
+        return FRD(self._fresp_batch/other._fresp_batch, self.omega,
                    smooth=(self._ifunc is not None) and
-                          (other._ifunc is not None))
+                          (other._ifunc is not None),
+                   _batch_first=True)
 
-    # TODO: Division of MIMO transfer function objects is not written yet.
     def __rtruediv__(self, other):
         """Right divide two LTI objects."""
         if isinstance(other, (int, float, complex, np.number)):
-            return FRD(other / self.fresp, self.omega,
-                       smooth=(self._ifunc is not None))
+            return FRD(other / self._fresp_batch, self.omega,
+                       smooth=(self._ifunc is not None), _batch_first=True)
         else:
             other = _convert_to_frd(other, omega=self.omega)
 
-        if (self.ninputs > 1 or self.noutputs > 1):
-            # FRD.__rtruediv__ is currently only implemented for SISO systems
-            return NotImplemented
-
         return other / self
 
     def __pow__(self, other):
@@ -595,11 +698,24 @@ class FrequencyResponseData(LTI):
         if other == 0:
             return FRD(ones(self.fresp.shape), self.omega,
                        smooth=(self._ifunc is not None))  # unity
-        if other > 0:
-            return self * (self**(other-1))
         if other < 0:
-            return (FRD(ones(self.fresp.shape), self.omega) / self) * \
-                (self**(other+1))
+            # Invert the positive power, batching over frequencies
+            base = (self**-other)._fresp_batch
+            fresp = 1. / base if self.issiso() else linalg.inv(base)
+            return FRD(fresp, self.omega,
+                       smooth=(self._ifunc is not None), _batch_first=True)
+
+        # Exponentiation by squaring, batching matmul over frequencies
+        result, base, n = None, self._fresp_batch, other
+        while True:
+            if n & 1:
+                result = base if result is None else result @ base
+            n >>= 1
+            if n == 0:
+                break
+            base = base @ base
+        return FRD(result, self.omega,
+                   smooth=(self._ifunc is not None), _batch_first=True)
 
     # Define the `eval` function to evaluate an FRD at a given (real)
     # frequency.  Note that we choose to use `eval` instead of `evalfr` to
@@ -648,21 +764,34 @@ class FrequencyResponseData(LTI):
             raise ValueError("FRD.eval can only accept real-valued omega")
 
         if self._ifunc is None:
-            elements = np.isin(self.omega, omega)  # binary array
-            if sum(elements) < len(omega_array):
+            # Find the frequencies by binary search (self.omega is sorted),
+            # comparing against the grid points on either side of the
+            # insertion index and taking the nearer one
+            idx = np.searchsorted(self.omega, omega_array)
+            above = np.clip(idx, 0, self.omega.size - 1)
+            below = np.clip(idx - 1, 0, self.omega.size - 1)
+            elements = where(
+                np.abs(self.omega[above] - omega_array)
+                <= np.abs(self.omega[below] - omega_array), above, below)
+            if (np.abs(self.omega[elements] - omega_array)
+                    >= self._epsw).any():
                 raise ValueError(
                     "not all frequencies omega are in frequency list of FRD "
                     "system. Try an interpolating FRD for additional points.")
             else:
-                out = self.fresp[:, :, elements]
+                out = np.moveaxis(self._fresp_batch[elements], 0, -1)
         else:
+            # Evaluate the spline for each channel at all frequencies at
+            # once; the inner loop over frequency (and knot intervals)
+            # runs in compiled FITPACK code, so only the (small) number
+            # of channels is iterated at the Python level
             out = empty((self.noutputs, self.ninputs, len(omega_array)),
                         dtype=complex)
-            for i in range(self.noutputs):
-                for j in range(self.ninputs):
-                    for k, w in enumerate(omega_array):
-                        frraw = splev(w, self._ifunc[i, j], der=0)
-                        out[i, j, k] = frraw[0] + 1.0j * frraw[1]
+            if len(omega_array) > 0:    # splev chokes on empty arrays
+                for i in range(self.noutputs):
+                    for j in range(self.ninputs):
+                        frraw = splev(omega_array, self._ifunc[i, j], der=0)
+                        out[i, j, :] = frraw[0] + 1.0j * frraw[1]
 
         return _process_frequency_response(self, omega, out, squeeze=squeeze)
 
@@ -733,15 +862,18 @@ class FrequencyResponseData(LTI):
 
             return response
 
+        s_arr = np.atleast_1d(s)
+
         # Make sure that we are operating on a simple list
-        if len(np.atleast_1d(s).shape) > 1:
+        if s_arr.ndim > 1:
             raise ValueError("input list must be 1D")
 
-        if any(abs(np.atleast_1d(s).real) > 0):
+        if np.any(np.abs(s_arr.real) > 0):
             raise ValueError("__call__: FRD systems can only accept "
                              "purely imaginary frequencies")
 
-        # need to preserve array or scalar status
+        # need to preserve array or scalar status (including 0-d arrays,
+        # which atleast_1d would promote to 1-d)
         if hasattr(s, '__len__'):
             return self.eval(np.asarray(s).imag, squeeze=squeeze)
         else:
@@ -749,34 +881,73 @@ class FrequencyResponseData(LTI):
 
     # Implement iter to allow assigning to a tuple
     def __iter__(self):
-        fresp = _process_frequency_response(
-            self, self.omega, self.fresp, squeeze=self.squeeze)
         if self._return_singvals:
             # Legacy processing for singular values
             return iter((self.fresp[:, 0, :], self.omega))
         elif not self.return_magphase:
+            fresp = _process_frequency_response(
+                self, self.omega, self.fresp, squeeze=self.squeeze)
             return iter((self.omega, fresp))
-        return iter((np.abs(fresp), np.angle(fresp), self.omega))
+
+        # Use the magnitude and phase properties, which cache their
+        # results, instead of recomputing abs/angle on every iteration
+        mag = _process_frequency_response(
+            self, self.omega, self.magnitude, squeeze=self.squeeze)
+        phase = _process_frequency_response(
+            self, self.omega, self.phase, squeeze=self.squeeze)
+        return iter((mag, phase, self.omega))
 
     def __getitem__(self, key):
         if not isinstance(key, Iterable) or len(key) != 2:
+            if isinstance(key, (int, np.integer)):
+                # Legacy indexing; only compute the requested component
+                if self._return_singvals:
+                    return (self.fresp[:, 0, :], self.omega)[key]
+                elif not self.return_magphase:
+                    if range(2)[key] == 0:
+                        return self.omega
+                    return _process_frequency_response(
+                        self, self.omega, self.fresp, squeeze=self.squeeze)
+                else:
+                    if (key := range(3)[key]) == 2:
+                        return self.omega
+                    return _process_frequency_response(
+                        self, self.omega,
+                        self.magnitude if key == 0 else self.phase,
+                        squeeze=self.squeeze)
+
             # Implement (thin) getitem to allow access via legacy indexing
             return list(self.__iter__())[key]
 
-        # Convert signal names to integer offsets (via NamedSignal object)
-        iomap = NamedSignal(
-            self.fresp[:, :, 0], self.output_labels, self.input_labels)
-        indices = iomap._parse_key(key, level=1)  # ignore index checks
+        # Convert signal names to integer offsets (via NamedSignal object,
+        # built once and reused as long as the labels are unchanged; only
+        # its shape and labels are used for parsing keys)
+        if self._iomap is None or \
+                self._iomap.signal_labels != self.output_labels or \
+                self._iomap.trace_labels != self.input_labels:
+            self._iomap = NamedSignal(
+                empty((self.noutputs, self.ninputs)),
+                self.output_labels, self.input_labels)
+        indices = self._iomap._parse_key(key, level=1)  # ignore index checks
         outdx, outputs = _process_subsys_index(indices[0], self.output_labels)
         inpdx, inputs = _process_subsys_index(indices[1], self.input_labels)
 
-        # Create the system name
-        sysname = config.defaults['iosys.indexed_system_name_prefix'] + \
-            self.name + config.defaults['iosys.indexed_system_name_suffix']
+        # Create the system name (binding the defaults dict once)
+        defaults = config.defaults
+        sysname = defaults['iosys.indexed_system_name_prefix'] + \
+            self.name + defaults['iosys.indexed_system_name_suffix']
+
+        # Index outputs and inputs in a single operation, without an
+        # intermediate copy of the selected output channels
+        if isinstance(outdx, list) and isinstance(inpdx, list):
+            fresp = self._fresp_batch[np.ix_(
+                np.arange(len(self.omega)), outdx, inpdx)]
+        else:
+            fresp = self._fresp_batch[:, outdx, inpdx]
 
         return FrequencyResponseData(
-            self.fresp[outdx, :][:, inpdx], self.omega, self.dt,
-            inputs=inputs, outputs=outputs, name=sysname)
+            fresp, self.omega, self.dt,
+            inputs=inputs, outputs=outputs, name=sysname, _batch_first=True)
 
     # Implement (thin) len to emulate legacy testing interface
     def __len__(self):
@@ -809,14 +980,28 @@ class FrequencyResponseData(LTI):
 
         # TODO: handle omega re-mapping
 
-        # reorder array axes in order to leverage numpy broadcasting
-        myfresp = np.moveaxis(self.fresp, 2, 0)
-        otherfresp = np.moveaxis(other.fresp, 2, 0)
-        I_AB = eye(self.ninputs)[np.newaxis, :, :] + otherfresp @ myfresp
-        resfresp = (myfresp @ linalg.inv(I_AB))
-        fresp = np.moveaxis(resfresp, 0, 2)
+        # the internal storage is already frequency-axis first, so the
+        # matrix operations below broadcast with no axis reordering
+        myfresp = self._fresp_batch
+        otherfresp = other._fresp_batch
+        # I_AB = I + B @ A, adding 1 to the diagonals in place rather
+        # than broadcasting an identity matrix over the batch
+        I_AB = otherfresp @ myfresp
+        idx = np.arange(self.ninputs)
+        I_AB[:, idx, idx] += 1.0
+        if self.ninputs == 1:
+            # the loop matrix is 1x1 at each frequency, so the solve is
+            # an elementwise division (no batched LU needed)
+            resfresp = myfresp / I_AB
+        else:
+            # resfresp = myfresp @ inv(I_AB), computed by a (batched)
+            # transposed solve rather than forming the inverse explicitly
+            resfresp = linalg.solve(
+                I_AB.swapaxes(-1, -2),
+                myfresp.swapaxes(-1, -2)).swapaxes(-1, -2)
 
-        return FRD(fresp, other.omega, smooth=(self._ifunc is not None))
+        return FRD(resfresp, other.omega,
+                   smooth=(self._ifunc is not None), _batch_first=True)
 
     def append(self, other):
         """Append a second model to the present model.
@@ -828,15 +1013,17 @@ class FrequencyResponseData(LTI):
 
         # TODO: handle omega re-mapping
 
-        new_fresp = np.zeros(
-            (self.noutputs + other.noutputs, self.ninputs + other.ninputs,
-             self.omega.shape[-1]), dtype=complex)
-        new_fresp[:self.noutputs, :self.ninputs, :] = np.reshape(
-            self.fresp, (self.noutputs, self.ninputs, -1))
-        new_fresp[self.noutputs:, self.ninputs:, :] = np.reshape(
-            other.fresp, (other.noutputs, other.ninputs, -1))
+        new_fresp = empty(
+            (self.omega.shape[-1],
+             self.noutputs + other.noutputs, self.ninputs + other.ninputs),
+            dtype=np.result_type(self.fresp.dtype, other.fresp.dtype))
+        new_fresp[:, :self.noutputs, :self.ninputs] = self._fresp_batch
+        new_fresp[:, self.noutputs:, self.ninputs:] = other._fresp_batch
+        new_fresp[:, :self.noutputs, self.ninputs:] = 0
+        new_fresp[:, self.noutputs:, :self.ninputs] = 0
 
-        return FRD(new_fresp, self.omega, smooth=(self._ifunc is not None))
+        return FRD(new_fresp, self.omega,
+                   smooth=(self._ifunc is not None), _batch_first=True)
 
     # Plotting interface
     def plot(self, plot_type=None, *args, **kwargs):
@@ -878,14 +1065,16 @@ class FrequencyResponseData(LTI):
             ImportError('pandas not installed')
         import pandas
 
-        # Create a dict for setting up the data frame
-        data = {'omega': self.omega}
-        data.update(
-            {'H_{%s, %s}' % (out, inp): self.fresp[i, j] \
-             for i, out in enumerate(self.output_labels) \
-             for j, inp in enumerate(self.input_labels)})
+        # The frequency-axis-first storage reshapes to one column per
+        # input/output pair, in the same order as the column labels
+        data = pandas.DataFrame(
+            self._fresp_batch.reshape(len(self.omega), -1),
+            columns=[f'H_{{{out}, {inp}}}'
+                     for out in self.output_labels
+                     for inp in self.input_labels])
+        data.insert(0, 'omega', self.omega)
 
-        return pandas.DataFrame(data)
+        return data
 
 
 #
@@ -929,9 +1118,17 @@ def _convert_to_frd(sys, omega, inputs=1, outputs=1):
     """
 
     if isinstance(sys, FRD):
-        omega.sort()
-        if len(omega) == len(sys.omega) and \
-           (abs(omega - sys.omega) < FRD._epsw).all():
+        if sys.omega is omega:
+            # arithmetic against the FRD whose omega we were handed;
+            # nothing to check or convert
+            return sys
+        if not np.all(omega[1:] >= omega[:-1]):
+            # only sort when needed (and without mutating the caller's
+            # array); omega is usually already monotonic
+            omega = np.sort(omega)
+        if np.array_equal(omega, sys.omega) or \
+           (len(omega) == len(sys.omega) and
+            np.abs(omega - sys.omega).max() < FRD._epsw):
             # frequencies match, and system was already frd; simply use
             return sys
 
@@ -939,28 +1136,33 @@ def _convert_to_frd(sys, omega, inputs=1, outputs=1):
             "Frequency ranges of FRD do not match, conversion not implemented")
 
     elif isinstance(sys, LTI):
-        omega = np.sort(omega)
+        if not np.all(omega[1:] >= omega[:-1]):
+            omega = np.sort(omega)
         if sys.isctime():
             fresp = sys(1j * omega)
         else:
-            fresp = sys(np.exp(1j * omega * sys.dt))
+            # z = exp(1j * omega * dt), via sin/cos as in the FRD
+            # constructor
+            theta = omega * sys.dt
+            z = empty(theta.shape, dtype=complex)
+            z.real = np.cos(theta)
+            z.imag = np.sin(theta)
+            fresp = sys(z)
         if len(fresp.shape) == 1:
             fresp = fresp[np.newaxis, np.newaxis, :]
         return FRD(fresp, omega, smooth=True)
 
     elif isinstance(sys, (int, float, complex, np.number)):
-        fresp = ones((outputs, inputs, len(omega)), dtype=float)*sys
-        return FRD(fresp, omega, smooth=True)
+        fresp = np.full((len(omega), outputs, inputs), sys, dtype=complex)
+        return FRD(fresp, omega, smooth=True, _batch_first=True)
 
     # try converting constant matrices
     try:
         sys = array(sys)
         outputs, inputs = sys.shape
-        fresp = empty((outputs, inputs, len(omega)), dtype=float)
-        for i in range(outputs):
-            for j in range(inputs):
-                fresp[i, j, :] = sys[i, j]
-        return FRD(fresp, omega, smooth=True)
+        fresp = empty((len(omega), outputs, inputs), dtype=complex)
+        fresp[:] = sys
+        return FRD(fresp, omega, smooth=True, _batch_first=True)
     except Exception:
         pass
 
@@ -606,6 +606,56 @@ class TestFRD:
         np.testing.assert_array_almost_equal(expected.omega, result.omega)
         np.testing.assert_array_almost_equal(expected.fresp, result.fresp)
 
+    def test_truediv_mimo(self):
+        # Division of MIMO FRD by MIMO FRD: G1/G2 = G1 * inv(G2)
+        rng = np.random.default_rng(1234)
+        n = 10
+        omega = np.logspace(-1, 1, n)
+        d1 = rng.uniform(size=(2, 2, n)) + 1j * rng.uniform(size=(2, 2, n))
+        d2 = rng.uniform(size=(2, 2, n)) + 1j * rng.uniform(size=(2, 2, n))
+        frd1 = frd(d1, omega)
+        frd2 = frd(d2, omega)
+
+        result = frd1 / frd2
+        expected = np.moveaxis(
+            np.moveaxis(d1, -1, 0) @ np.linalg.inv(np.moveaxis(d2, -1, 0)),
+            0, -1)
+        np.testing.assert_array_almost_equal(result.omega, omega)
+        np.testing.assert_array_almost_equal(result.fresp, expected)
+
+        # Multiplying back by the divisor recovers the numerator
+        np.testing.assert_array_almost_equal((result * frd2).fresp, d1)
+
+        # Constant matrix divided by MIMO FRD takes the same path
+        result = np.eye(2) / frd2
+        expected = np.moveaxis(np.linalg.inv(np.moveaxis(d2, -1, 0)), 0, -1)
+        np.testing.assert_array_almost_equal(result.fresp, expected)
+
+        # The divisor must be square and of matching size
+        frd_wide = frd(rng.uniform(size=(1, 2, n)), omega)
+        with pytest.raises(ValueError, match="G2 must be square"):
+            frd1 / frd_wide
+        frd3 = frd(rng.uniform(size=(3, 3, n)), omega)
+        with pytest.raises(ValueError, match="size mismatch"):
+            frd1 / frd3
+
+    def test_pow_mimo(self):
+        # Negative powers of a MIMO FRD invert the matrix power
+        rng = np.random.default_rng(1234)
+        n = 10
+        omega = np.logspace(-1, 1, n)
+        d = rng.uniform(size=(2, 2, n)) + 1j * rng.uniform(size=(2, 2, n))
+        sys_frd = frd(d, omega)
+
+        d_batch = np.moveaxis(d, -1, 0)
+        expected = np.moveaxis(np.linalg.inv(d_batch @ d_batch), 0, -1)
+        np.testing.assert_array_almost_equal((sys_frd**-2).fresp, expected)
+
+        # G**-2 * G**2 should be the identity at each frequency
+        result = np.moveaxis((sys_frd**-2 * sys_frd**2).fresp, -1, 0)
+        np.testing.assert_array_almost_equal(
+            result, np.broadcast_to(np.eye(2), (n, 2, 2)))
+
     @slycotonly
     def test_rtruediv_mimo_siso(self):
         omega = np.logspace(-1, 1, 10)
@@ -712,6 +762,13 @@ class TestFRD:
         np.testing.assert_almost_equal(sys_tf(1j), frd_tf.eval(1))
         np.testing.assert_almost_equal(sys_tf(1j), frd_tf(1j))
 
+        # Frequencies within the matching tolerance are accepted whether
+        # they fall just below or just above a grid point
+        np.testing.assert_almost_equal(
+            frd_tf.eval(1 - 1e-10), frd_tf.eval(1))
+        np.testing.assert_almost_equal(
+            frd_tf.eval(1 + 1e-10), frd_tf.eval(1))
+
         # Should get an error if we evaluate at an unknown frequency
         with pytest.raises(ValueError, match="not .* in frequency list"):
             frd_tf.eval(2)
@@ -724,6 +781,29 @@ class TestFRD:
         with pytest.raises(ValueError, match="only accept purely imaginary"):
             frd_tf(2)
 
+    def test_eval_unsorted_omega(self):
+        # Frequencies passed to the constructor need not be sorted
+        sys_frd = frd([1.0, 2.0, 3.0], [3.0, 1.0, 2.0])
+        np.testing.assert_array_almost_equal(sys_frd.omega, [1.0, 2.0, 3.0])
+        np.testing.assert_almost_equal(sys_frd.eval(1.0), 2.0)
+        np.testing.assert_almost_equal(sys_frd.eval(3.0), 1.0)
+
+    def test_fresp_immutable(self):
+        omega = np.array([0.1, 1.0, 10.0])
+        data = np.array([1 + 1j, 2 + 2j, 3 + 3j])
+        sys_frd = frd(data, omega)
+
+        # Response data is presented as a read-only view
+        with pytest.raises(ValueError, match="read-only"):
+            sys_frd.fresp[0, 0, 0] = 0.
+        with pytest.raises(ValueError, match="read-only"):
+            sys_frd.magnitude[0, 0, 0] = 0.
+
+        # Constructor keeps its own copy of the data
+        mag = sys_frd.magnitude.copy()
+        data *= 2
+        np.testing.assert_array_equal(sys_frd.magnitude, mag)
+
     def test_freqresp_deprecated(self):
         sys_tf = ct.tf([1], [1, 2, 1])
         frd_tf = frd(sys_tf, np.logspace(-1, 1, 3))
@@ -854,6 +934,7 @@ def test_frequency_response():
 
     # Make sure we get the right answers in various ways
     np.testing.assert_equal(resp.magnitude, np.abs(eval))
+    np.testing.assert_allclose(resp.magnitude_squared, np.abs(eval)**2)
     np.testing.assert_equal(resp.phase, np.angle(eval))
     np.testing.assert_equal(resp.omega, omega)
 
@@ -10,6 +10,11 @@ import control as ct
 from control.tests.conftest import mplcleanup, slycotonly
 
 
+# Responses computed in test_response_plots, which depend only on the
+# response function and system, not on the plot options being swept
+response_cache = {}
+
+
 # Detailed test of (almost) all functionality
 #
 # The commented out rows lead to very long testing times => these should be
@@ -117,7 +122,13 @@ def test_response_plots(
     # Create a new figure (in case previous one is of the same size) and plot
     if not clear:
         plt.figure()
-    response = fcn(sys, *args)
+
+    # Compute the response, reusing the response from a previous set of
+    # plot options if we have already computed it (the arguments are
+    # determined by fcn and sys, so they don't need to be in the key)
+    if (cache_key := (fcn, sys)) not in response_cache:
+        response_cache[cache_key] = fcn(sys, *args)
+    response = response_cache[cache_key]
 
     # Look for cases where there are no data to plot
     if not pltout and (